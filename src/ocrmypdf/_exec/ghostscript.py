@@ -9,6 +9,7 @@ import logging
 import os
 import re
 import sys
+from functools import lru_cache
 from io import BytesIO
 from os import fspath
 from pathlib import Path
@@ -43,14 +44,18 @@ if os.name == 'nt':
 GS = _GSWIN if _GSWIN else 'gs'
 del _GSWIN
 
+GS_ERROR = re.compile(r'error', flags=re.IGNORECASE)
 
+
+@lru_cache(maxsize=None)
 def version():
+    # Every call would otherwise start a Ghostscript interpreter just to print
+    # its version, and the version is checked several times per run
     return get_version(GS)
 
 
 def _gs_error_reported(stream) -> bool:
-    match = re.search(r'error', stream, flags=re.IGNORECASE)
-    return bool(match)
+    return bool(GS_ERROR.search(stream))
 
 
 def rasterize_pdf(
@@ -69,6 +74,16 @@ def rasterize_pdf(
     if not page_dpi:
         page_dpi = raster_dpi
 
+    # Unless the image must be rotated or have its resolution changed, let
+    # Ghostscript write it to its destination, rather than capturing it on
+    # stdout and decoding and re-encoding it with Pillow
+    write_direct = not rotation and page_dpi.round(6) == raster_dpi
+    if write_direct:
+        # Ghostscript treats % in output filenames as a page number template
+        gs_output = fspath(output_file).replace('%', '%%')
+    else:
+        gs_output = '-'
+
     args_gs = (
         [
             GS,
@@ -85,7 +100,7 @@ def rasterize_pdf(
         + (['-dFILTERVECTOR'] if filter_vector else [])
         + [
             '-o',
-            '-',
+            gs_output,
             '-sstdout=%stderr',  # Literal %s, not string interpolation
             '-dAutoRotatePages=/None',  # Probably has no effect on raster
             '-f',
@@ -104,6 +119,15 @@ def rasterize_pdf(
             log.error(stderr)
 
     try:
+        if write_direct:
+            try:
+                with Image.open(output_file):
+                    pass  # Only confirm that Ghostscript produced a valid image
+            except FileNotFoundError as e:
+                raise UnidentifiedImageError(
+                    f"Ghostscript did not write {output_file}"
+                ) from e
+            return
         with Image.open(BytesIO(p.stdout)) as im:
             if rotation is not None:
                 log.debug("Rotating output by %i", rotation)
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import re
+from contextlib import suppress
 from math import pi
 from os import fspath
 from pathlib import Path
@@ -294,6 +295,16 @@ def _generate_null_hocr(output_hocr: Path, output_text: Path, image: Path) -> No
     output_text.write_text('[skipped page]', encoding='utf-8')
 
 
+def _rename_sidecar_text(prefix: Path, output_text: Path) -> None:
+    # The sidecar text file will get the suffix .txt; rename it to whatever
+    # caller wants it named. Usually that is already its name.
+    sidecar = prefix.with_suffix('.txt')
+    if sidecar == output_text:
+        return
+    with suppress(FileNotFoundError):
+        sidecar.replace(output_text)
+
+
 def generate_hocr(
     *,
     input_file: Path,
@@ -347,10 +358,7 @@ def generate_hocr(
         raise SubprocessOutputError() from e
     else:
         tesseract_log_output(stdout)
-        # The sidecar text file will get the suffix .txt; rename it to
-        # whatever caller wants it named
-        if prefix.with_suffix('.txt').exists():
-            prefix.with_suffix('.txt').replace(output_text)
+        _rename_sidecar_text(prefix, output_text)
 
 
 def use_skip_page(output_pdf: Path, output_text: Path) -> None:
@@ -405,8 +413,7 @@ def generate_pdf(
     try:
         p = run(args_tesseract, stdout=PIPE, stderr=STDOUT, timeout=timeout, check=True)
         stdout = p.stdout
-        if prefix.with_suffix('.txt').exists():
-            prefix.with_suffix('.txt').replace(output_text)
+        _rename_sidecar_text(prefix, output_text)
     except TimeoutExpired:
         page_timedout(timeout)
         use_skip_page(output_pdf, output_text)
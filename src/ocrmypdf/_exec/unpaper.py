@@ -135,7 +135,6 @@ def run_unpaper(
         args_unpaper.extend([os.fspath(input_png), os.fspath(output_pnm)])
         run(
             args_unpaper,
-            close_fds=True,
             check=True,
             stderr=STDOUT,  # unpaper writes logging output to stdout and stderr
             stdout=PIPE,  # and cannot send file output to stdout
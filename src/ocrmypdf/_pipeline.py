@@ -13,7 +13,7 @@ import sys
 from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
-from shutil import copyfileobj
+from shutil import copyfile, copyfileobj
 from typing import Any, BinaryIO, Iterable, Sequence, cast
 
 import img2pdf
@@ -264,6 +264,13 @@ def get_canvas_square_dpi(pageinfo: PageInfo, options) -> Resolution:
     return Resolution(units, units)
 
 
+def count_selected_pages(options, npages: int) -> int:
+    """Count the pages of an ``npages`` long PDF that ``--pages`` selects."""
+    if not options.pages:
+        return npages
+    return sum(1 for pageno in options.pages if 0 <= pageno < npages)
+
+
 def is_ocr_required(page_context: PageContext) -> bool:
     pageinfo = page_context.pageinfo
     options = page_context.options
@@ -520,6 +527,7 @@ def create_ocr_image(image: Path, page_context: PageContext) -> Path:
     with Image.open(image) as im:
         log.debug('resolution %r', im.info['dpi'])
 
+        modified = False
         if not options.force_ocr:
             # Do not mask text areas when forcing OCR, because we need to OCR
             # all text areas
@@ -527,10 +535,13 @@ def create_ocr_image(image: Path, page_context: PageContext) -> Path:
             if options.redo_ocr:
                 mask = True  # Mask visible text, but not invisible text
 
-            draw = ImageDraw.ImageDraw(im)
+            draw = None
             for textarea in page_context.pageinfo.get_textareas(
                 visible=mask, corrupt=None
             ):
+                if draw is None:
+                    draw = ImageDraw.ImageDraw(im)
+                    modified = True
                 # Calculate resolution based on the image size and page dimensions
                 # without regard whatever resolution is in pageinfo (may differ or
                 # be None)
@@ -549,12 +560,20 @@ def create_ocr_image(image: Path, page_context: PageContext) -> Path:
         filter_im = page_context.plugin_manager.hook.filter_ocr_image(
             page=page_context, image=im
         )
-        if filter_im is not None:
+        if filter_im is not None and filter_im is not im:
             im = filter_im
+            modified = True
+        # A filter could also draw on the image it was given and return it, but
+        # Pillow must load the pixel data to do so, which empties im.tile
+        if not modified and im.format == 'PNG' and im.tile:
+            # The image is unchanged; reuse the file instead of re-encoding it
+            safe_symlink(image, output_file)
+            return output_file
 
         # Pillow requires integer DPI
         dpi = tuple(round(coord) for coord in im.info['dpi'])
-        im.save(output_file, dpi=dpi)
+        # Only the OCR engine reads this file, so favor speed over size
+        im.save(output_file, dpi=dpi, compress_level=1)
     return output_file
 
 
@@ -898,18 +917,25 @@ def copy_final(
     input_file: Path, output_file: str | Path | BinaryIO, _context: PdfContext
 ) -> None:
     log.debug('%s -> %s', input_file, output_file)
-    with input_file.open('rb') as input_stream:
-        if output_file == '-':
+    if output_file == '-':
+        with input_file.open('rb') as input_stream:
             copyfileobj(input_stream, sys.stdout.buffer)  # type: ignore[misc]
-            sys.stdout.flush()
-        elif hasattr(output_file, 'writable'):
-            output_stream = cast(BinaryIO, output_file)
+        sys.stdout.flush()
+    elif hasattr(output_file, 'writable'):
+        output_stream = cast(BinaryIO, output_file)
+        with input_file.open('rb') as input_stream:
             copyfileobj(input_stream, output_stream)  # type: ignore[misc]
-            with suppress(AttributeError):
-                output_stream.flush()
+        with suppress(AttributeError):
+            output_stream.flush()
+    else:
+        # At this point we overwrite the output_file specified by the user
+        # use open() to create the file and get the appropriate umask,
+        # ownership, etc. copyfile does that too and lets the OS copy the
+        # data, but it refuses named pipes, so only use it for regular files
+        if os.path.isfile(output_file) or not os.path.exists(output_file):
+            copyfile(input_file, output_file)
         else:
-            # At this point we overwrite the output_file specified by the user
-            # use copyfileobj because then we use open() to create the file and
-            # get the appropriate umask, ownership, etc.
-            with open(output_file, 'wb') as output_stream:
+            with input_file.open('rb') as input_stream, open(
+                output_file, 'wb'
+            ) as output_stream:
                 copyfileobj(input_stream, output_stream)
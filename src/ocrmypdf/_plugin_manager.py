@@ -10,6 +10,7 @@ import importlib
 import importlib.util
 import pkgutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
@@ -44,21 +45,18 @@ class OcrmypdfPluginManager(pluggy.PluginManager):
         super().__init__(*args, **kwargs)
         self.setup_plugins()
 
-    def __getstate__(self):
-        state = dict(
-            init_args=self.__init_args,
-            plugins=self.__plugins,
-            builtins=self.__builtins,
-            init_kwargs=self.__init_kwargs,
-        )
-        return state
-
-    def __setstate__(self, state):
-        self.__init__(
-            *state['init_args'],
-            plugins=state['plugins'],
-            builtins=state['builtins'],
-            **state['init_kwargs'],
+    def __reduce__(self):
+        # Every PageContext sent to a worker carries the plugin manager, so
+        # reconstruct it through a per-process cache. Otherwise each page would
+        # import and register all plugins again.
+        return (
+            _revive_plugin_manager,
+            (
+                tuple(self.__init_args),
+                tuple(self.__plugins),
+                self.__builtins,
+                tuple(sorted(self.__init_kwargs.items())),
+            ),
         )
 
     def setup_plugins(self):
@@ -100,6 +98,15 @@ class OcrmypdfPluginManager(pluggy.PluginManager):
             self.register(module)
 
 
+@lru_cache(maxsize=None)
+def _revive_plugin_manager(
+    init_args: tuple, plugins: tuple[str | Path, ...], builtins: bool, init_kwargs
+) -> OcrmypdfPluginManager:
+    return OcrmypdfPluginManager(
+        *init_args, plugins=list(plugins), builtins=builtins, **dict(init_kwargs)
+    )
+
+
 def get_plugin_manager(plugins: list[str | Path], builtins=True):
     return OcrmypdfPluginManager(
         project_name='ocrmypdf',
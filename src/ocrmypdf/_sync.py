@@ -15,10 +15,11 @@ import sys
 import threading
 from concurrent.futures.process import BrokenProcessPool
 from concurrent.futures.thread import BrokenThreadPool
+from contextlib import contextmanager
 from functools import partial
 from pathlib import Path
 from tempfile import mkdtemp
-from typing import NamedTuple, Sequence, cast
+from typing import Iterator, NamedTuple, Sequence, cast
 
 import PIL
 
@@ -29,6 +30,7 @@ from ocrmypdf._logging import PageNumberFilter
 from ocrmypdf._pipeline import (
     convert_to_pdfa,
     copy_final,
+    count_selected_pages,
     create_ocr_image,
     create_pdf_page_from_image,
     create_visible_page_jpg,
@@ -254,7 +256,10 @@ def exec_concurrent(context: PdfContext, executor: Executor) -> Sequence[str]:
     """Execute the pipeline concurrently."""
     # Run exec_page_sync on every page context
     options = context.options
-    max_workers = min(len(context.pdfinfo), options.jobs)
+    # Pages excluded by --pages finish immediately, so there is no point in
+    # starting workers for them
+    npages = count_selected_pages(options, len(context.pdfinfo))
+    max_workers = max(1, min(npages, options.jobs))
     if max_workers > 1:
         log.info("Start processing %d pages concurrently", max_workers)
 
@@ -312,6 +317,25 @@ def exec_concurrent(context: PdfContext, executor: Executor) -> Sequence[str]:
     return messages
 
 
+@contextmanager
+def _scoped_environment() -> Iterator[None]:
+    """Undo any changes made to ``os.environ`` while processing one file.
+
+    Plugins may set environment variables in their ``validate`` hook to configure
+    the subprocesses used for this file. Those settings must neither leak into
+    the caller's process nor be mistaken for user settings by the next file.
+    """
+    saved = os.environ.copy()
+    try:
+        yield
+    finally:
+        for key in set(os.environ) - set(saved):
+            del os.environ[key]
+        for key, value in saved.items():
+            if os.environ.get(key) != value:
+                os.environ[key] = value
+
+
 def configure_debug_logging(
     log_filename: Path, prefix: str = ''
 ) -> logging.FileHandler:
@@ -384,11 +408,12 @@ def run_pipeline(
 
         context = PdfContext(options, work_folder, origin_pdf, pdfinfo, plugin_manager)
 
-        # Validate options are okay for this pdf
-        validate_pdfinfo_options(context)
+        with _scoped_environment():
+            # Validate options are okay for this pdf
+            validate_pdfinfo_options(context)
 
-        # Execute the pipeline
-        optimize_messages = exec_concurrent(context, executor)
+            # Execute the pipeline
+            optimize_messages = exec_concurrent(context, executor)
 
         if options.output_file == '-':
             log.info("Output sent to stdout")
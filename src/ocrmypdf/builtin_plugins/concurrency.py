@@ -124,11 +124,14 @@ class StandardExecutor(Executor):
             executor_class = ProcessPoolExecutor
             initializer = process_init
 
-        # Regardless of whether we use_threads for worker processes, the log_listener
-        # must be a thread. Make sure we create the listener after the worker pool,
-        # so that it does not get forked into the workers.
-        listener = threading.Thread(target=log_listener, args=(log_queue,))
-        listener.start()
+        # Worker threads log directly through the parent's handlers, which are
+        # already thread-safe, so no listener is needed for them. Worker processes
+        # send their log records over log_queue to a listener, which runs as a
+        # thread in this process.
+        listener = None
+        if not use_threads:
+            listener = threading.Thread(target=log_listener, args=(log_queue,))
+            listener.start()
 
         with self.pbar_class(**tqdm_kwargs) as pbar, executor_class(
             max_workers=max_workers,
@@ -155,11 +158,13 @@ class StandardExecutor(Executor):
                 raise
             finally:
                 # Terminate log listener
-                log_queue.put_nowait(None)
+                if listener is not None:
+                    log_queue.put_nowait(None)
 
         # When the above succeeds, wait for the listener thread to exit. (If
         # an exception occurs, we don't try to join, in case it deadlocks.)
-        listener.join()
+        if listener is not None:
+            listener.join()
 
 
 @hookimpl
@@ -5,10 +5,13 @@
 from __future__ import annotations
 
 import logging
+import os
 
 from ocrmypdf import hookimpl
 from ocrmypdf._exec import ghostscript
+from ocrmypdf._pipeline import count_selected_pages
 from ocrmypdf.exceptions import MissingDependencyError
+from ocrmypdf.helpers import clamp
 from ocrmypdf.subprocess import check_external_program
 
 log = logging.getLogger(__name__)
@@ -35,6 +38,24 @@ def check_options(options):
         options.output_type = 'pdfa-2'
 
 
+@hookimpl
+def validate(pdfinfo, options):
+    # Ghostscript can render the bands of a banded page on several threads. It
+    # bands a page when its bitmap exceeds MaxBitmap, so this tends to apply to
+    # large color pages and does not change how small pages are rendered. We
+    # only hand Ghostscript the cores that --jobs allows but that have no page
+    # to work on, up to 4, since more bands per page gain little. Ghostscript
+    # reads GS_OPTIONS from the environment, which worker processes inherit;
+    # the pipeline restores the environment when it is done with this file.
+    if 'GS_OPTIONS' in os.environ:
+        return  # Set by the user
+    npages = count_selected_pages(options, len(pdfinfo))
+    gs_threads = clamp(options.jobs // max(1, npages), 1, 4)
+    if gs_threads > 1:
+        os.environ['GS_OPTIONS'] = f'-dNumRenderingThreads={gs_threads}'
+    log.debug("Using %d Ghostscript rendering threads", gs_threads)
+
+
 @hookimpl
 def rasterize_pdf_page(
     input_file,
@@ -13,6 +13,7 @@ from PIL import Image
 from ocrmypdf import hookimpl
 from ocrmypdf._exec import tesseract
 from ocrmypdf._jobcontext import PageContext
+from ocrmypdf._pipeline import count_selected_pages
 from ocrmypdf.cli import numeric, str_to_int
 from ocrmypdf.helpers import clamp
 from ocrmypdf.imageops import calculate_downsample, downsample_image
@@ -168,8 +169,10 @@ def validate(pdfinfo, options):
     # input file is small, then we allow Tesseract to use threads, subject to the
     # constraint: (ocrmypdf workers) * (tesseract threads) <= max_workers.
     # As of Tesseract 4.1, 3 threads is the most effective on a 4 core/8 thread system.
+    # Only pages selected by --pages are OCRed, so only they occupy workers.
     if not os.environ.get('OMP_THREAD_LIMIT', '').isnumeric():
-        tess_threads = clamp(options.jobs // len(pdfinfo), 1, 3)
+        npages = count_selected_pages(options, len(pdfinfo))
+        tess_threads = clamp(options.jobs // max(1, npages), 1, 3)
         os.environ['OMP_THREAD_LIMIT'] = str(tess_threads)
     else:
         tess_threads = int(os.environ['OMP_THREAD_LIMIT'])
@@ -142,25 +142,39 @@ def safe_symlink(input_file: os.PathLike, soft_link_name: os.PathLike):
         )
         return
 
-    # Soft link already exists: delete for relink?
-    if os.path.lexists(soft_link_name):
-        # do not delete or overwrite real (non-soft link) file
-        if not os.path.islink(soft_link_name):
-            raise FileExistsError(f"{soft_link_name} exists and is not a link")
-        os.unlink(soft_link_name)
-
-    if not os.path.exists(input_file):
-        raise FileNotFoundError(f"trying to create a broken symlink to {input_file}")
-
     if os.name == 'nt':
         # Don't actually use symlinks on Windows due to permission issues
+        if os.path.lexists(soft_link_name):
+            # do not delete or overwrite real (non-soft link) file
+            if not os.path.islink(soft_link_name):
+                raise FileExistsError(f"{soft_link_name} exists and is not a link")
+            os.unlink(soft_link_name)
+        if not os.path.exists(input_file):
+            raise FileNotFoundError(
+                f"trying to create a broken symlink to {input_file}"
+            )
         shutil.copyfile(input_file, soft_link_name)
         return
 
     log.debug("os.symlink(%s, %s)", input_file, soft_link_name)
 
-    # Create symbolic link using absolute path
-    os.symlink(os.path.abspath(input_file), soft_link_name)
+    # Create symbolic link using absolute path. Attempt the link first, and only
+    # inspect the destination when something is already there.
+    target = os.path.abspath(input_file)
+    try:
+        os.symlink(target, soft_link_name)
+    except FileExistsError:
+        # do not delete or overwrite real (non-soft link) file
+        if not os.path.islink(soft_link_name):
+            raise FileExistsError(
+                f"{soft_link_name} exists and is not a link"
+            ) from None
+        os.unlink(soft_link_name)
+        os.symlink(target, soft_link_name)
+
+    if not os.path.exists(soft_link_name):
+        os.unlink(soft_link_name)
+        raise FileNotFoundError(f"trying to create a broken symlink to {input_file}")
 
 
 def samefile(file1: os.PathLike, file2: os.PathLike):
@@ -105,6 +105,7 @@ class HocrTransform:
     http://kba.cloud/hocr-spec/.
     """
 
+    xmlns_pattern = re.compile(r'({.*})html')
     box_pattern = re.compile(r'bbox((\s+\d+){4})')
     baseline_pattern = re.compile(
         r'''
@@ -124,7 +125,7 @@ class HocrTransform:
 
         # if the hOCR file has a namespace, ElementTree requires its use to
         # find elements
-        matches = re.match(r'({.*})html', self.hocr.getroot().tag)
+        matches = self.xmlns_pattern.match(self.hocr.getroot().tag)
         self.xmlns = ''
         if matches:
             self.xmlns = matches.group(1)
@@ -154,11 +155,7 @@ class HocrTransform:
 
     def _get_element_text(self, element: Element):
         """Return the textual content of the element and its children."""
-        text = ''
-        if element.text is not None:
-            text += element.text
-        for child in element:
-            text += self._get_element_text(child)
+        text = ''.join(element.itertext())
         if element.tail is not None:
             text += element.tail
         return text
@@ -244,16 +241,18 @@ class HocrTransform:
         # light blue for bounding box of paragraph
         pdf.setFillColor(cyan)
         pdf.setLineWidth(0)  # no line for bounding box
-        for elem in self.hocr.iterfind(self._child_xpath('p', 'ocr_par')):
-            elemtxt = self._get_element_text(elem).rstrip()
-            if len(elemtxt) == 0:
-                continue
+        if show_bounding_boxes:  # pragma: no cover
+            # Paragraphs are only drawn for debugging, so skip walking them
+            # otherwise
+            for elem in self.hocr.iterfind(self._child_xpath('p', 'ocr_par')):
+                elemtxt = self._get_element_text(elem).rstrip()
+                if len(elemtxt) == 0:
+                    continue
 
-            pxl_coords = self.element_coordinates(elem)
-            pt = self.pt_from_pixel(pxl_coords)  # pylint: disable=invalid-name
+                pxl_coords = self.element_coordinates(elem)
+                pt = self.pt_from_pixel(pxl_coords)  # pylint: disable=invalid-name
 
-            # draw the bbox border
-            if show_bounding_boxes:  # pragma: no cover
+                # draw the bbox border
                 pdf.rect(
                     pt.x1, self.height - pt.y2, pt.x2 - pt.x1, pt.y2 - pt.y1, fill=1
                 )
@@ -114,6 +114,9 @@ FRIENDLY_COMP: dict[Colorspace, int] = {
 
 UNIT_SQUARE = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
 
+# Zero or more Q, one or more q
+QQ_RUN = re.compile(r'Q*q+$')
+
 
 def _is_unit_square(shorthand):
     values = map(float, shorthand)
@@ -167,7 +170,7 @@ def _normalize_stack(graphobjs):
     """Convert runs of qQ's in the stack into single graphobjs."""
     for operands, operator in graphobjs:
         operator = str(operator)
-        if re.match(r'Q*q+$', operator):  # Zero or more Q, one or more q
+        if QQ_RUN.match(operator):
             for char in operator:  # Split into individual
                 yield ([], char)  # Yield individual
         else:
@@ -708,7 +711,11 @@ def _pdf_pageinfo_concurrent(
     total = len(pdf.pages)
 
     use_threads = False  # No performance gain if threaded due to GIL
-    n_workers = min(1 + len(pages) // 4, max_workers)
+    # Only pages in check_pages have their content streams scanned; the rest are
+    # quick to describe. Size the pool by the former, since every worker process
+    # has to open and parse the whole PDF again.
+    n_checked = sum(1 for n in range(total) if n in check_pages)
+    n_workers = min(1 + n_checked // 4, max_workers)
     if n_workers == 1:
         # But if we decided on only one worker, there is no point in using
         # a separate process.
@@ -100,14 +100,15 @@ def run_polling_stderr(
 
     with Popen(args, env=env, **kwargs) as proc:
         lines = []
-        while proc.poll() is None:
-            if proc.stderr is None:
-                continue
+        if proc.stderr is not None:
+            # Block on each line as it arrives until the process closes stderr,
+            # rather than polling the process for its exit
             for msg in iter(proc.stderr.readline, ''):
                 if process_log.isEnabledFor(logging.DEBUG):
                     process_log.debug(msg.strip())
                 callback(msg)
                 lines.append(msg)
+        proc.wait()
         stderr = ''.join(lines)
 
         if check and proc.returncode != 0:
@@ -117,11 +118,13 @@ def run_polling_stderr(
 
 def _fix_process_args(
     args: Args, env: OsEnviron | None, kwargs
-) -> tuple[Args, OsEnviron, logging.Logger, bool]:
+) -> tuple[Args, OsEnviron | None, logging.Logger, bool]:
     assert 'universal_newlines' not in kwargs, "Use text= instead of universal_newlines"
 
     if not env:
-        env = os.environ
+        # Let the child inherit our environment, rather than having subprocess
+        # rebuild it from os.environ on every launch
+        env = None
 
     # Search in spoof path if necessary
     program = str(args[0])
@@ -130,7 +133,7 @@ def _fix_process_args(
         # pylint: disable=import-outside-toplevel
         from ocrmypdf.subprocess._windows import fix_windows_args
 
-        args = fix_windows_args(program, args, env)
+        args = fix_windows_args(program, args, env or os.environ)
 
     log.debug("Running: %s", args)
     process_log = log.getChild(os.path.basename(program))
@@ -159,7 +162,6 @@ def get_version(
     try:
         proc = run(
             args_prog,
-            close_fds=True,
             text=True,
             stdout=PIPE,
             stderr=STDOUT,
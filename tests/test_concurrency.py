@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import os
+import pickle
 
 import pytest
 
 from ocrmypdf import ExitCode
+from ocrmypdf._plugin_manager import get_plugin_manager
 
 from .conftest import run_ocrmypdf_api
 
@@ -23,3 +25,11 @@ def test_simulate_oom_killer(multipage, no_outpdf):
         'tests/plugins/tesseract_simulate_oom_killer.py',
     )
     assert exitcode == ExitCode.child_process_error
+
+
+def test_plugin_manager_unpickles_once_per_process():
+    plugin_manager = get_plugin_manager([])
+    revived = pickle.loads(pickle.dumps(plugin_manager))
+    assert revived is not plugin_manager
+    assert len(revived.get_plugins()) == len(plugin_manager.get_plugins())
+    assert pickle.loads(pickle.dumps(plugin_manager)) is revived
@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
+from argparse import Namespace
 from decimal import Decimal
 from unittest.mock import patch
 
@@ -13,6 +15,8 @@ import pytest
 from PIL import Image, UnidentifiedImageError
 
 from ocrmypdf._exec.ghostscript import rasterize_pdf
+from ocrmypdf._sync import _scoped_environment
+from ocrmypdf.builtin_plugins import ghostscript as ghostscript_plugin
 from ocrmypdf.exceptions import ExitCode
 from ocrmypdf.helpers import Resolution
 
@@ -141,3 +145,76 @@ def test_rasterize_pdf_errors(resources, no_outpdf, caplog):
             )
         assert "this is an error" in caplog.text
         assert "invalid page image file" in caplog.text
+
+
+@pytest.mark.parametrize('image_bytes', [None, b'', b'not an image'])
+def test_rasterize_pdf_direct_write_invalid(resources, outdir, caplog, image_bytes):
+    out = outdir / 'out.png'
+
+    def fake_gs(args, **kwargs):
+        assert args[args.index('-o') + 1] == str(out)
+        if image_bytes is not None:
+            out.write_bytes(image_bytes)
+        return subprocess.CompletedProcess(args, returncode=0, stdout=b'', stderr=b'')
+
+    with patch('ocrmypdf._exec.ghostscript.run', side_effect=fake_gs):
+        with pytest.raises(UnidentifiedImageError):
+            rasterize_pdf(
+                resources / 'francais.pdf',
+                out,
+                raster_device='pngmono',
+                raster_dpi=Resolution(100, 100),
+            )
+    assert "invalid page image file" in caplog.text
+
+
+def test_rasterize_pdf_direct_write(resources, outdir):
+    out = outdir / 'out.png'
+
+    def fake_gs(args, **kwargs):
+        # Ghostscript is told to write the page image to its destination itself
+        assert args[args.index('-o') + 1] == str(out)
+        Image.new('1', (10, 10)).save(out)
+        return subprocess.CompletedProcess(args, returncode=0, stdout=b'', stderr=b'')
+
+    with patch('ocrmypdf._exec.ghostscript.run', side_effect=fake_gs) as mock:
+        rasterize_pdf(
+            resources / 'francais.pdf',
+            out,
+            raster_device='pngmono',
+            raster_dpi=Resolution(300, 300),
+            # As unrounded page resolutions from pdfinfo often are
+            page_dpi=Resolution(300.00000000000006, 299.9999999999999),
+        )
+    mock.assert_called_once()
+    with Image.open(out) as im:
+        assert im.size == (10, 10)
+
+
+def test_rendering_threads_recalculated_per_file(monkeypatch):
+    # Let monkeypatch own GS_OPTIONS, so that it is removed again after the test
+    monkeypatch.setenv('GS_OPTIONS', '')
+    monkeypatch.delenv('GS_OPTIONS')
+
+    def process_file(npages, jobs):
+        options = Namespace(pages=None, jobs=jobs)
+        with _scoped_environment():
+            ghostscript_plugin.validate(pdfinfo=[None] * npages, options=options)
+            gs_options = os.environ.get('GS_OPTIONS')
+        assert 'GS_OPTIONS' not in os.environ
+        return gs_options
+
+    assert process_file(npages=1, jobs=8) == '-dNumRenderingThreads=4'
+    assert process_file(npages=100, jobs=8) is None
+    assert process_file(npages=32, jobs=64) == '-dNumRenderingThreads=2'
+    assert process_file(npages=1, jobs=2) == '-dNumRenderingThreads=2'
+
+
+def test_rendering_threads_respect_user_gs_options(monkeypatch):
+    monkeypatch.setenv('GS_OPTIONS', '-dNumRenderingThreads=1')
+    with _scoped_environment():
+        ghostscript_plugin.validate(
+            pdfinfo=[None], options=Namespace(pages=None, jobs=8)
+        )
+        assert os.environ['GS_OPTIONS'] == '-dNumRenderingThreads=1'
+    assert os.environ['GS_OPTIONS'] == '-dNumRenderingThreads=1'
@@ -29,6 +29,11 @@ class TestSafeSymlink:
         with pytest.raises(FileExistsError):
             helpers.safe_symlink(tmp_path / 'input', tmp_path / 'regular_file')
 
+    def test_safe_symlink_broken(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            helpers.safe_symlink(tmp_path / 'missing', tmp_path / 'link')
+        assert not os.path.lexists(tmp_path / 'link')
+
     @needs_symlink
     def test_safe_symlink_relink(self, tmp_path):
         (tmp_path / 'regular_file_a').touch()
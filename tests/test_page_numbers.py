@@ -3,10 +3,18 @@
 
 from __future__ import annotations
 
+import os
+from argparse import Namespace
+from unittest.mock import Mock
+
 import pytest
 
 import ocrmypdf
+from ocrmypdf._jobcontext import PdfContext
+from ocrmypdf._plugin_manager import get_plugin_manager
+from ocrmypdf._sync import exec_concurrent
 from ocrmypdf._validation import _pages_from_ranges
+from ocrmypdf.builtin_plugins import tesseract_ocr
 from ocrmypdf.exceptions import BadArgsError
 from ocrmypdf.pdfinfo import PdfInfo
 
@@ -61,3 +69,31 @@ def test_limited_pages(multipage, outpdf):
     assert not pi.pages[0].has_text
     assert pi.pages[4].has_text
     assert pi.pages[5].has_text
+
+
+class _StopExecutor(Exception):
+    pass
+
+
+def test_limited_pages_size_workers_and_threads(multipage, tmp_path, monkeypatch):
+    # Let monkeypatch own OMP_THREAD_LIMIT, so that it is removed after the test
+    monkeypatch.setenv('OMP_THREAD_LIMIT', '')
+    monkeypatch.delenv('OMP_THREAD_LIMIT')
+    # Page 42 does not exist in this 6 page file, so only 2 pages are selected
+    options = Namespace(
+        pages={4, 5, 41},
+        jobs=8,
+        use_threads=True,
+        tesseract_timeout=180.0,
+        progress_bar=False,
+    )
+    pdfinfo = PdfInfo(multipage)
+    context = PdfContext(options, tmp_path, multipage, pdfinfo, get_plugin_manager([]))
+
+    executor = Mock(side_effect=_StopExecutor)
+    with pytest.raises(_StopExecutor):
+        exec_concurrent(context, executor)
+    assert executor.call_args.kwargs['max_workers'] == 2
+
+    tesseract_ocr.validate(pdfinfo, options)
+    assert os.environ['OMP_THREAD_LIMIT'] == '3'  # 8 // 2, clamped to 3
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from io import BytesIO
 from unittest.mock import Mock
 
 import pytest
@@ -144,3 +147,151 @@ def test_dpi_needed(image, text, vector, result, rgb_image, outdir):
 )
 def test_enumerate_compress_ranges(name, input, output):
     assert output == tuple(_pipeline.enumerate_compress_ranges(input))
+
+
+@pytest.fixture
+def page_texts(tmp_path):
+    first = tmp_path / 'first.txt'
+    first.write_text('first page\f', encoding='utf-8')
+    last = tmp_path / 'last.txt'
+    last.write_text('last page \u00e9', encoding='utf-8')
+    return [first, None, None, last]
+
+
+SIDECAR_TEXT = 'first page\f[OCR skipped on page(s) 2-3]\flast page \u00e9'
+
+
+@pytest.fixture
+def pdf_context(tmp_path):
+    work_folder = tmp_path / 'work'
+    work_folder.mkdir()
+    return Mock(get_path=lambda name: work_folder / name)
+
+
+def test_merge_sidecars_to_path(page_texts, pdf_context, tmp_path):
+    sidecar = tmp_path / 'sidecar.txt'
+    text = _pipeline.merge_sidecars(page_texts, pdf_context)
+    _pipeline.copy_final(text, sidecar, pdf_context)
+    assert sidecar.read_text(encoding='utf-8') == SIDECAR_TEXT
+
+
+class _WriteOnlyStream:
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+
+def test_merge_sidecars_to_stream(page_texts, pdf_context):
+    stream = _WriteOnlyStream()
+    text = _pipeline.merge_sidecars(page_texts, pdf_context)
+    _pipeline.copy_final(text, stream, pdf_context)
+    assert b''.join(stream.chunks).decode('utf-8') == SIDECAR_TEXT
+
+
+def test_copy_final_to_path(tmp_path):
+    work_file = tmp_path / 'work.pdf'
+    work_file.write_bytes(b'%PDF-1.7 longer first contents')
+    work_file.chmod(0o600)
+    output_file = tmp_path / 'output.pdf'
+
+    old_umask = os.umask(0o022)
+    try:
+        _pipeline.copy_final(work_file, output_file, Mock())
+    finally:
+        os.umask(old_umask)
+    assert output_file.read_bytes() == b'%PDF-1.7 longer first contents'
+    if os.name != 'nt':
+        # The output is created with the umask, not the work file's permissions
+        assert output_file.stat().st_mode & 0o777 == 0o644
+
+    work_file.write_bytes(b'%PDF-1.7 second')
+    _pipeline.copy_final(work_file, output_file, Mock())
+    assert output_file.read_bytes() == b'%PDF-1.7 second'
+
+    if hasattr(os, 'mkfifo'):
+        fifo = tmp_path / 'output.fifo'
+        os.mkfifo(fifo)
+        received = []
+        reader = threading.Thread(
+            target=lambda: received.append(fifo.read_bytes()), daemon=True
+        )
+        reader.start()
+        _pipeline.copy_final(work_file, fifo, Mock())
+        reader.join()
+        assert received == [b'%PDF-1.7 second']
+
+
+def test_copy_final_to_stream(tmp_path):
+    work_file = tmp_path / 'work.pdf'
+    work_file.write_bytes(b'%PDF-1.7 contents')
+    stream = BytesIO()
+    _pipeline.copy_final(work_file, stream, Mock())
+    assert stream.getvalue() == b'%PDF-1.7 contents'
+
+
+@pytest.fixture
+def ocr_page_context(pdf_context):
+    page_context = Mock(get_path=pdf_context.get_path)
+    page_context.options.force_ocr = False
+    page_context.options.redo_ocr = False
+    page_context.pageinfo.get_textareas.return_value = []
+    # Behave like a filter_ocr_image hook that returns the image unchanged
+    page_context.plugin_manager.hook.filter_ocr_image.side_effect = (
+        lambda page, image: image
+    )
+    return page_context
+
+
+@pytest.fixture
+def page_image(tmp_path):
+    image = tmp_path / 'page.png'
+    Image.new('L', (72, 72), color=0).save(image, dpi=(72, 72))
+    return image
+
+
+def test_create_ocr_image_unchanged(page_image, ocr_page_context):
+    output = _pipeline.create_ocr_image(page_image, ocr_page_context)
+    if os.name != 'nt':
+        assert output.is_symlink()
+    assert output.read_bytes() == page_image.read_bytes()
+
+
+def test_create_ocr_image_masked(page_image, ocr_page_context):
+    # A text area covering the bottom left quarter of the page, in PDF points
+    ocr_page_context.pageinfo.get_textareas.return_value = [(0, 0, 36, 36)]
+    output = _pipeline.create_ocr_image(page_image, ocr_page_context)
+    assert not output.is_symlink()
+    with Image.open(output) as im:
+        assert im.getpixel((10, 60)) == 255
+        assert im.getpixel((60, 10)) == 0
+
+
+def test_create_ocr_image_filtered(page_image, ocr_page_context):
+    def filter_ocr_image(page, image):
+        filtered = Image.new('L', image.size, color=128)
+        filtered.info['dpi'] = image.info['dpi']
+        return filtered
+
+    ocr_page_context.plugin_manager.hook.filter_ocr_image.side_effect = filter_ocr_image
+    output = _pipeline.create_ocr_image(page_image, ocr_page_context)
+    assert not output.is_symlink()
+    with Image.open(output) as im:
+        assert im.getpixel((10, 10)) == 128
+
+
+def test_create_ocr_image_filtered_in_place(page_image, ocr_page_context):
+    def filter_ocr_image(page, image):
+        image.paste(128, (0, 0, 36, 36))
+        return image
+
+    ocr_page_context.plugin_manager.hook.filter_ocr_image.side_effect = filter_ocr_image
+    output = _pipeline.create_ocr_image(page_image, ocr_page_context)
+    assert not output.is_symlink()
+    with Image.open(output) as im:
+        assert im.getpixel((10, 10)) == 128